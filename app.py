@@ -1,28 +1,93 @@
-from flask import Flask, render_template_string, request, session
-from utils import BookingSystem, FAQHandler
-from main import parse_date, parse_time, parse_intent
+from flask import Flask, Response, request, session
+from flask.json.provider import JSONProvider
+from utils import HELP_TEXT, BookingCatalog, BookingSystem, FAQHandler, parse_date, parse_intent, parse_time
+from typing import Optional
+import json
+import os
 import secrets
 
+try:
+    import orjson
+except ImportError:  # optional; Flask's default JSON provider is used instead
+    orjson = None
+
 app = Flask(__name__)
-app.secret_key = secrets.token_hex(16)
+# Every worker must sign the session cookie with the same key, so set
+# SECRET_KEY when running more than one. The random key only suits a single process.
+app.secret_key = os.environ.get("SECRET_KEY") or secrets.token_hex(16)
+
+
+class OrjsonProvider(JSONProvider):
+    """Serve request and response bodies (and the session cookie) with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        # Formatting options such as separators don't apply; orjson is always compact.
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+if orjson is not None:
+    app.json = OrjsonProvider(app)
 
-booking_system = BookingSystem()
+# With REDIS_URL set, booking state lives in Redis and the cookie only carries
+# a session id. Otherwise it is kept in Flask's signed cookie session.
+REDIS_URL = os.environ.get("REDIS_URL")
+BOOKING_STATE_TTL = 30 * 60  # seconds; abandoned bookings expire on their own
+
+if REDIS_URL:
+    import redis
+
+    redis_client = redis.Redis.from_url(REDIS_URL)
+else:
+    redis_client = None
+
+# Loaded at import so a preloading server (e.g. gunicorn --preload) reads
+# data.json once and its forked workers share the catalog.
+catalog = BookingCatalog()
+booking_system = BookingSystem(catalog=catalog)
 faq_handler = FAQHandler(booking_system)
 
+# Replies for every intent except "book", which also starts the booking flow.
+INTENT_HANDLERS = {
+    "locations": faq_handler.get_locations_response,
+    "services": faq_handler.get_services_response,
+    "help": lambda: HELP_TEXT,
+    "exit": lambda: "Thank you for using our service. Goodbye! (Refresh to start over)",
+}
+
+def get_booking_state() -> Optional[dict]:
+    """Return the current booking-flow state, or None if not booking."""
+    if redis_client is None:
+        return session.get("booking_state")
+    sid = session.get("sid")
+    if sid is None:
+        return None
+    raw = redis_client.get(f"sess:{sid}")
+    return json.loads(raw) if raw else None
+
+
+def set_booking_state(state: dict):
+    """Store the booking-flow state for this session."""
+    if redis_client is None:
+        session["booking_state"] = state
+        return
+    sid = session.get("sid")
+    if sid is None:
+        sid = session["sid"] = secrets.token_urlsafe(16)
+    redis_client.set(f"sess:{sid}", json.dumps(state), ex=BOOKING_STATE_TTL)
 
-HELP_TEXT = """
-How can I help you today?
 
-  - Type "book" to schedule a two-hour appointment
-  - Type "services" to see what services we offer
-  - Type "locations" to see which areas we serve
-  - Type "quit" to exit
+def clear_booking_state():
+    """End the booking flow for this session."""
+    if redis_client is None:
+        session.pop("booking_state", None)
+        return
+    sid = session.get("sid")
+    if sid is not None:
+        redis_client.delete(f"sess:{sid}")
 
-You can also ask questions like:
-  - "I need to book an appointment"
-  - "What services do you offer?"
-  - "Where are you located?"
-"""
 
 def handle_message(user_input: str) -> str:
     """Process user message and return response."""
@@ -30,35 +95,32 @@ def handle_message(user_input: str) -> str:
     if not user_input:
         return ""
 
-    booking_state = session.get("booking_state")
+    booking_state = get_booking_state()
     if booking_state:
         return handle_booking_flow(user_input, booking_state)
 
     intent = parse_intent(user_input)
 
     if intent == "book":
-        session["booking_state"] = {"step": "name"}
+        set_booking_state({"step": "name"})
         return "Let's book an appointment!\n\nWhat is your name?"
-    elif intent == "locations":
-        return faq_handler.get_locations_response()
-    elif intent == "services":
-        return faq_handler.get_services_response()
-    elif intent == "help":
-        return HELP_TEXT
-    elif intent == "exit":
-        return "Thank you for using our service. Goodbye! (Refresh to start over)"
-    else:
-        return "I'm not sure I understand. Type 'help' to see what I can do, or 'book' to schedule an appointment."
+
+    handler = INTENT_HANDLERS.get(intent)
+    if handler is not None:
+        return handler()
+    return "I'm not sure I understand. Type 'help' to see what I can do, or 'book' to schedule an appointment."
 
 
 def handle_booking_flow(user_input: str, state: dict) -> str:
-    """Handle multi-step booking flow."""
+    """Handle multi-step booking flow.
+
+    Each step that advances updates ``state`` in place; it is saved once at
+    the end rather than in every branch.
+    """
     step = state.get("step")
-    services = booking_system.get_available_services()
-    zones = booking_system.get_service_zones()
 
     if user_input.lower() in ["cancel", "quit", "exit"]:
-        session.pop("booking_state", None)
+        clear_booking_state()
         return "Booking cancelled.\n\n" + HELP_TEXT
 
     if step == "name":
@@ -66,25 +128,22 @@ def handle_booking_flow(user_input: str, state: dict) -> str:
             return "Name is required. What is your name?"
         state["customer_name"] = user_input
         state["step"] = "service"
-        session["booking_state"] = state
-        return f"Nice to meet you, {user_input}!\n\nAvailable services: {', '.join(s.title() for s in services)}\n\nWhat service do you need?"
+        reply = f"Nice to meet you, {user_input}!\n\nAvailable services: {booking_system.services_text}\n\nWhat service do you need?"
 
     elif step == "service":
         service = user_input.lower()
-        if service not in services:
-            return f"Sorry, '{user_input}' is not a valid service.\n\nAvailable: {', '.join(s.title() for s in services)}"
+        if not booking_system.offers_service(service):
+            return f"Sorry, '{user_input}' is not a valid service.\n\nAvailable: {booking_system.services_text}"
         state["service"] = service
         state["step"] = "zip"
-        session["booking_state"] = state
-        return f"We serve: {', '.join(zones)}\n\nWhat is your zip code?"
+        reply = f"We serve: {booking_system.zones_text}\n\nWhat is your zip code?"
 
     elif step == "zip":
-        if user_input not in zones:
-            return f"Sorry, we don't serve '{user_input}'.\n\nWe serve: {', '.join(zones)}"
+        if not booking_system.serves_zone(user_input):
+            return f"Sorry, we don't serve '{user_input}'.\n\nWe serve: {booking_system.zones_text}"
         state["zip_code"] = user_input
         state["step"] = "date"
-        session["booking_state"] = state
-        return "What date would you like? (e.g., 2025-02-15 or Feb 15, 2025)"
+        reply = "What date would you like? (e.g., 2025-02-15 or Feb 15, 2025)"
 
     elif step == "date":
         date = parse_date(user_input)
@@ -92,8 +151,7 @@ def handle_booking_flow(user_input: str, state: dict) -> str:
             return f"Could not parse '{user_input}'.\n\nPlease use a format like '2025-02-15' or 'February 15, 2025'."
         state["date"] = date
         state["step"] = "time"
-        session["booking_state"] = state
-        return "What time would you like? (e.g., 10:00 AM or 2pm)"
+        reply = "What time would you like? (e.g., 10:00 AM or 2pm)"
 
     elif step == "time":
         time = parse_time(user_input)
@@ -106,10 +164,14 @@ def handle_booking_flow(user_input: str, state: dict) -> str:
             date=state["date"],
             time=time,
         )
-        session.pop("booking_state", None)
+        clear_booking_state()
         return message
 
-    return "Something went wrong. Type 'book' to start over."
+    else:
+        return "Something went wrong. Type 'book' to start over."
+
+    set_booking_state(state)
+    return reply
 
 
 HTML_TEMPLATE = """
@@ -214,12 +276,15 @@ How can I help you today?
 </body>
 </html>
 """
+# The page has no template variables, so it is encoded once and served as-is.
+HTML_BYTES = HTML_TEMPLATE.encode("utf-8")
 
 
 @app.route("/")
 def index():
+    clear_booking_state()
     session.clear()
-    return render_template_string(HTML_TEMPLATE)
+    return Response(HTML_BYTES, mimetype="text/html")
 
 
 @app.route("/chat", methods=["POST"])
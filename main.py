@@ -1,121 +1,35 @@
-from utils import BookingSystem, FAQHandler
-from datetime import datetime
-import re
-from typing import Optional
+from utils import HELP_TEXT, BookingSystem, FAQHandler, parse_date, parse_intent, parse_time
 
 def get_input(prompt: str) -> str:
-    """Get user input with a prompt."""
-    return input(f"{prompt}: ").strip()
-
-def parse_date(date_str: str) -> Optional[str]:
-    """Parse various date formats and return standardized format, or None if invalid."""
-    date_str = date_str.strip()
-
-    date_formats = [
-        "%Y-%m-%d",           # 2026-12-02
-        "%m/%d/%Y",            # 12/2/2026, 12/02/2026
-        "%m-%d-%Y",            # 12-2-2026
-        "%d/%m/%Y",            # 2/12/2026 (European)
-        "%d-%m-%Y",            # 2-12-2026
-        "%B %d, %Y",           # December 2, 2026
-        "%b %d, %Y",           # Dec 2, 2026
-        "%d %B %Y",            # 2 December 2026
-        "%d %b %Y",            # 2 Dec 2026
-        "%Y/%m/%d",            # 2026/12/02
-        "%m/%d/%y",            # 12/2/26
-        "%d/%m/%y",            # 2/12/26
-    ]
-
-    for fmt in date_formats:
-        try:
-            dt = datetime.strptime(date_str, fmt)
-            return dt.strftime("%B %d, %Y")
-        except ValueError:
-            continue
-
-    return None
-
-def parse_time(time_str: str) -> Optional[str]:
-    """Parse various time formats and return standardized format, or None if invalid."""
-    time_str = time_str.strip().upper()
-
-    hour_match = re.match(r'^(\d{1,2})\s*(AM|PM)?$', time_str)
-    if hour_match:
-        hour = int(hour_match.group(1))
-        am_pm = hour_match.group(2) or ""
-
-        if hour < 1 or hour > 12:
-            return None
-
-        if not am_pm:
-            am_pm = "AM"
-
-        time_str = f"{hour:02d}:00 {am_pm}"
-        try:
-            dt = datetime.strptime(time_str, "%I:%M %p")
-            return dt.strftime("%I:%M %p")
-        except ValueError:
-            pass
-
-    am_pm_formats = [
-        "%I:%M %p",            # 10:30 AM
-        "%I:%M%p",             # 10:30AM
-        "%I %p",               # 10 AM
-        "%I%p",                # 10AM
-        "%I:%M:%S %p",         # 10:30:45 AM
-        "%I:%M:%S%p",          # 10:30:45AM
-    ]
-
-    for fmt in am_pm_formats:
-        try:
-            dt = datetime.strptime(time_str, fmt)
-            return dt.strftime("%I:%M %p")
-        except ValueError:
-            continue
-
-    hour_minute_formats = [
-        "%H:%M",               # 14:30
-        "%H:%M:%S",            # 14:30:45
-        "%H",                  # 14
-    ]
-
-    for fmt in hour_minute_formats:
-        try:
-            dt = datetime.strptime(time_str, fmt)
-            return dt.strftime("%I:%M %p")
-        except ValueError:
-            continue
-
-    return None
+    """Get user input with a prompt (including its trailing ": ")."""
+    return input(prompt).strip()
 
 
 def handle_booking(booking_system: BookingSystem):
     """Handle the appointment booking flow."""
     print("\n--- Book an Appointment ---")
 
-    customer_name = get_input("Your name")
+    customer_name = get_input("Your name: ")
     if not customer_name:
         print("Name is required.")
         return
 
     print(f"Nice to meet you, {customer_name}!")
-    services = booking_system.get_available_services()
-    print(f"Available services: {', '.join(s.title() for s in services)}")
-    service = get_input("Service needed (e.g., plumbing, electrical, hvac)").lower()
-    if service not in services:
+    print(f"Available services: {booking_system.services_text}")
+    service = get_input("Service needed (e.g., plumbing, electrical, hvac): ").lower()
+    if not booking_system.offers_service(service):
         print(f"Sorry, '{service}' is not a valid service.")
         return
 
-    zones = booking_system.get_service_zones()
-    print(f"We serve zip codes: {', '.join(zones)}")
-    zip_code = get_input("Your zip code")
-    if zip_code not in zones:
+    print(f"We serve zip codes: {booking_system.zones_text}")
+    zip_code = get_input("Your zip code: ")
+    if not booking_system.serves_zone(zip_code):
         print(f"Sorry, we don't serve zip code '{zip_code}'.")
         return
 
     # Get and validate date with reprompting
     while True:
-        date_input = get_input("Preferred date (e.g., 2025-02-15)")
+        date_input = get_input("Preferred date (e.g., 2025-02-15): ")
         if not date_input:
             print("Date is required.")
             continue
@@ -127,7 +41,7 @@ def handle_booking(booking_system: BookingSystem):
 
     # Get and validate time with reprompting
     while True:
-        time_input = get_input("Preferred time (e.g., 10:00 AM)")
+        time_input = get_input("Preferred time (e.g., 10:00 AM): ")
         if not time_input:
             print("Time is required.")
             continue
@@ -147,45 +61,9 @@ def handle_booking(booking_system: BookingSystem):
     print(f"\n{message}")
 
 
-def parse_intent(user_input: str) -> str:
-    """Parse user input to determine intent."""
-    text = user_input.lower()
-
-    if any(word in text for word in ["book", "appointment", "schedule"]):
-        return "book"
-
-    if any(word in text for word in ["location", "where", "area", "zip", "zone"]):
-        return "locations"
-
-    if any(word in text for word in ["service", "offer", "what do you", "help with"]):
-        return "services"
-
-    if any(word in text for word in ["quit", "exit", "bye", "goodbye"]):
-        return "exit"
-
-    if any(word in text for word in ["help"]):
-        return "help"
-
-    return "unknown"
-
-
 def print_help():
     """Print help message."""
-    print(
-        """
-How can I help you today?
-
-  - Type "book" to schedule a two-hour appointment
-  - Type "services" to see what services we offer
-  - Type "locations" to see which areas we serve
-  - Type "quit" to exit
-
-You can also ask questions like:
-  - "I need to book an appointment"
-  - "What services do you offer?"
-  - "Where are you located?"
-"""
-    )
+    print(HELP_TEXT)
 
 
 def main():
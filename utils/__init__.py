@@ -1,2 +1,3 @@
-from .booking import BookingSystem
-from .faq import FAQHandler
\ No newline at end of file
+from .booking import AppointmentStore, BookingCatalog, BookingSystem
+from .faq import HELP_TEXT, FAQHandler
+from .parsing import parse_date, parse_intent, parse_time
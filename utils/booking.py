@@ -1,16 +1,46 @@
+"""Booking logic and data models.
+
+Numba JIT is intentionally not used here: the work is string and dict
+lookups (technician names, zones, dates, times), which Numba can only run
+in object mode, slower than plain CPython. See numba/numba#2585. Speedups
+come from indexing (catalog lookups, the per-day schedule) and from
+precompiled regexes for parsing instead.
+"""
 import json
-from datetime import datetime
+import re
+import sys
+from bisect import bisect_left, insort
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional; the standard library parser is used instead
+    orjson = None
+
+UNAVAILABLE_MESSAGE = (
+    "Sorry, no technician is available for %s in zip code %s on %s at %s.\n"
+    "Please try a different time or date."
+)
+CONFIRMATION_MESSAGE = """Appointment confirmed!
+  Customer: %s
+  Service: %s
+  Technician: %s
+  Location: %s
+  Date: %s
+  Time: %s
+"""
+
+@dataclass(slots=True, frozen=True)
 class Technician:
     id: int
     name: str
-    zones: list[str]
-    business_units: list[str]
+    zones: frozenset[str]
+    business_units: frozenset[str]
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Appointment:
     customer_name: str
     technician_name: str
@@ -18,38 +48,143 @@ class Appointment:
     zip_code: str
     date: str
     time: str
+    # Start time as minutes past midnight, or None if `time` isn't "HH:MM AM".
+    time_minutes: Optional[int]
+
+# Same inputs datetime.strptime(time, "%I:%M %p") accepts, without its overhead.
+CLOCK_TIME_PATTERN = re.compile(r"(1[0-2]|0[1-9]|[1-9]):([0-5]\d|\d)\s+(AM|PM)", re.IGNORECASE)
+
+def _to_minutes(time: str) -> Optional[int]:
+    """Convert an "HH:MM AM" time to minutes past midnight, or None if invalid."""
+    match = CLOCK_TIME_PATTERN.fullmatch(time)
+    if match is None:
+        return None
+    hour, minute, am_pm = match.groups()
+    hour = int(hour) % 12 + (12 if am_pm.upper() == "PM" else 0)
+    return hour * 60 + int(minute)
+
+class BookingCatalog:
+    """Technicians and lookup indexes loaded from the data file.
+
+    Never modified after loading, so a server that loads it before forking
+    workers shares the same pages with all of them.
+    """
 
-class BookingSystem:
     def __init__(self, data_file: str = "data.json"):
-        self.technicians: list[Technician] = []
-        self.appointments: list[Appointment] = []
-        self._load_data(data_file)
-
-    def _load_data(self, data_file: str):
-        with open(data_file, "r") as f:
-            data = json.load(f)
-
-        for tech in data["Technician_Profiles"]:
-            self.technicians.append(
-                Technician(
-                    id=tech["id"],
-                    name=tech["name"],
-                    zones=tech["zones"],
-                    business_units=tech["business_units"],
-                )
+        with open(data_file, "rb") as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+        self.technicians: tuple[Technician, ...] = tuple(
+            Technician(
+                id=tech["id"],
+                name=sys.intern(tech["name"]),
+                zones=frozenset(sys.intern(zone) for zone in tech["zones"]),
+                business_units=frozenset(
+                    sys.intern(unit.lower()) for unit in tech["business_units"]
+                ),
             )
+            for tech in data["Technician_Profiles"]
+        )
 
-    def get_available_services(self) -> list[str]:
-        services = set()
+        # Technicians able to take each (service, zip code), in file order.
+        by_service_zone: dict[tuple[str, str], list[Technician]] = defaultdict(list)
         for tech in self.technicians:
-            services.update(tech.business_units)
-        return sorted(services)
+            for unit in tech.business_units:
+                for zone in tech.zones:
+                    by_service_zone[(unit, zone)].append(tech)
+        self._by_service_zone = {key: tuple(techs) for key, techs in by_service_zone.items()}
 
-    def get_service_zones(self) -> list[str]:
-        zones = set()
-        for tech in self.technicians:
-            zones.update(tech.zones)
-        return sorted(zones)
+        self.services: tuple[str, ...] = tuple(
+            sorted({unit for tech in self.technicians for unit in tech.business_units})
+        )
+        self.zones: tuple[str, ...] = tuple(
+            sorted({zone for tech in self.technicians for zone in tech.zones})
+        )
+        self.service_set = frozenset(self.services)
+        self.zone_set = frozenset(self.zones)
+
+    def technicians_for(self, service: str, zip_code: str) -> tuple[Technician, ...]:
+        """Technicians offering the service in the zip code, in file order."""
+        return self._by_service_zone.get((service, zip_code), ())
+
+class AppointmentStore:
+    """Booked appointments, held in process memory.
+
+    Each server worker gets its own store; replace it with a shared backend
+    to keep bookings consistent across workers.
+    """
+
+    def __init__(self):
+        self.appointments: list[Appointment] = []
+        # Booked start times (minutes past midnight), sorted, per (technician, date).
+        self._schedule: dict[tuple[str, str], list[int]] = defaultdict(list)
+
+    def add(self, appointment: Appointment):
+        self.appointments.append(appointment)
+        if appointment.time_minutes is not None:
+            key = (appointment.technician_name, appointment.date)
+            insort(self._schedule[key], appointment.time_minutes)
+
+    def is_booked(self, technician_name: str, date: str, time: str) -> bool:
+        """Check if technician has a conflicting appointment (within 2 hours)."""
+        minutes = _to_minutes(time)
+        if minutes is None:
+            return any(
+                appt.technician_name == technician_name
+                and appt.date == date
+                and appt.time == time
+                for appt in self.appointments
+            )
+
+        # Only the booked times either side of the new one can be within 2 hours.
+        booked = self._schedule.get((technician_name, date), ())
+        i = bisect_left(booked, minutes)
+        if i < len(booked) and booked[i] - minutes < 120:
+            return True
+        if i > 0 and minutes - booked[i - 1] < 120:
+            return True
+        return False
+
+class BookingSystem:
+    def __init__(
+        self,
+        data_file: str = "data.json",
+        catalog: Optional[BookingCatalog] = None,
+        store: Optional[AppointmentStore] = None,
+    ):
+        self.catalog = catalog if catalog is not None else BookingCatalog(data_file)
+        self.store = store if store is not None else AppointmentStore()
+
+    @property
+    def technicians(self) -> tuple[Technician, ...]:
+        return self.catalog.technicians
+
+    @property
+    def appointments(self) -> list[Appointment]:
+        return self.store.appointments
+
+    def get_available_services(self) -> tuple[str, ...]:
+        return self.catalog.services
+
+    def get_service_zones(self) -> tuple[str, ...]:
+        return self.catalog.zones
+
+    @cached_property
+    def services_text(self) -> str:
+        """Services for display, e.g. "Electrical, Hvac, Plumbing"."""
+        return ", ".join(s.title() for s in self.catalog.services)
+
+    @cached_property
+    def zones_text(self) -> str:
+        """Zip codes served, comma-separated for display."""
+        return ", ".join(self.catalog.zones)
+
+    def offers_service(self, service: str) -> bool:
+        return service in self.catalog.service_set
+
+    def serves_zone(self, zip_code: str) -> bool:
+        return zip_code in self.catalog.zone_set
 
     def find_technician(
         self, service: str, zip_code: str, date: str, time: str
@@ -57,34 +192,11 @@ class BookingSystem:
         """Find a technician that matches service, zone, and is available."""
         service = service.lower()
 
-        for tech in self.technicians:
-            if service not in tech.business_units:
-                continue
-            if zip_code not in tech.zones:
-                continue
-            if self._is_booked(tech, date, time):
-                continue
-            return tech
+        for tech in self.catalog.technicians_for(service, zip_code):
+            if not self.store.is_booked(tech.name, date, time):
+                return tech
         return None
 
-    def _is_booked(self, tech: Technician, date: str, time: str) -> bool:
-        """Check if technician has a conflicting appointment (within 2 hours)."""
-        for appt in self.appointments:
-            if appt.technician_name != tech.name:
-                continue
-            if appt.date != date:
-                continue
-            try:
-                appt_time = datetime.strptime(appt.time, "%I:%M %p")
-                new_time = datetime.strptime(time, "%I:%M %p")
-                diff_minutes = abs((new_time - appt_time).total_seconds() / 60)
-                if diff_minutes < 120:
-                    return True
-            except ValueError:
-                if appt.time == time:
-                    return True
-        return False
-
     def book_appointment(
         self, customer_name: str, service: str, zip_code: str, date: str, time: str
     ) -> str:
@@ -92,7 +204,7 @@ class BookingSystem:
         tech = self.find_technician(service, zip_code, date, time)
 
         if tech is None:
-            return f"""Sorry, no technician is available for {service} in zip code {zip_code} on {date} at {time}.\nPlease try a different time or date."""
+            return UNAVAILABLE_MESSAGE % (service, zip_code, date, time)
 
         appointment = Appointment(
             customer_name=customer_name,
@@ -101,14 +213,10 @@ class BookingSystem:
             zip_code=zip_code,
             date=date,
             time=time,
+            time_minutes=_to_minutes(time),
         )
-        self.appointments.append(appointment)
+        self.store.add(appointment)
 
-        return f"""Appointment confirmed!
-  Customer: {customer_name}
-  Service: {service}
-  Technician: {tech.name}
-  Location: {zip_code}
-  Date: {date}
-  Time: {time}
-"""
\ No newline at end of file
+        return CONFIRMATION_MESSAGE % (
+            customer_name, service, tech.name, zip_code, date, time
+        )
@@ -1,20 +1,35 @@
 from .booking import BookingSystem
 
+HELP_TEXT = """
+How can I help you today?
+
+  - Type "book" to schedule a two-hour appointment
+  - Type "services" to see what services we offer
+  - Type "locations" to see which areas we serve
+  - Type "quit" to exit
+
+You can also ask questions like:
+  - "I need to book an appointment"
+  - "What services do you offer?"
+  - "Where are you located?"
+"""
+
 
 class FAQHandler:
     def __init__(self, booking_system: BookingSystem):
         self.booking_system = booking_system
-
-    def get_locations_response(self) -> str:
-        zones = self.booking_system.get_service_zones()
-        return (
+        # The catalog never changes after loading, so the replies are built once.
+        self._locations_response = (
             "We serve the following zip codes in San Francisco:\n"
-            f"  {', '.join(zones)}"
+            f"  {booking_system.zones_text}"
         )
-
-    def get_services_response(self) -> str:
-        services = self.booking_system.get_available_services()
-        return (
+        self._services_response = (
             "We offer the following services:\n"
-            f"  {', '.join(s.title() for s in services)}"
+            f"  {booking_system.services_text}"
         )
+
+    def get_locations_response(self) -> str:
+        return self._locations_response
+
+    def get_services_response(self) -> str:
+        return self._services_response
@@ -0,0 +1,183 @@
+from functools import lru_cache
+import calendar
+import re
+from typing import Optional
+
+try:
+    import ahocorasick
+except ImportError:  # optional; INTENT_PATTERNS is used instead
+    ahocorasick = None
+
+# Keywords per intent, in priority order. With pyahocorasick installed they
+# are matched in one pass over the input; otherwise each intent's compiled
+# alternation is searched in turn. Either way matching is on the lowercased text.
+INTENT_KEYWORDS = {
+    "book": ("book", "appointment", "schedule"),
+    "locations": ("location", "where", "area", "zip", "zone"),
+    "services": ("service", "offer", "what do you", "help with"),
+    "exit": ("quit", "exit", "bye", "goodbye"),
+    "help": ("help",),
+}
+INTENT_PRIORITY = {intent: rank for rank, intent in enumerate(INTENT_KEYWORDS)}
+
+def _build_automaton() -> "ahocorasick.Automaton":
+    automaton = ahocorasick.Automaton()
+    for intent, words in INTENT_KEYWORDS.items():
+        for word in words:
+            automaton.add_word(word, intent)
+    automaton.make_automaton()
+    return automaton
+
+if ahocorasick is not None:
+    INTENT_AUTOMATON = _build_automaton()
+    INTENT_PATTERNS = ()
+else:
+    INTENT_AUTOMATON = None
+    INTENT_PATTERNS = tuple(
+        (intent, re.compile("|".join(map(re.escape, words))))
+        for intent, words in INTENT_KEYWORDS.items()
+    )
+
+# Every accepted date shape in one pattern; the outer named group tells
+# parse_date which shape matched. Month/day ranges are checked afterwards.
+# Digits are spelled [0-9], so only ASCII digits are accepted. strptime let
+# non-ASCII digits through in some fields (%Y, the second digit of %d or %M,
+# ...); that is deliberately not carried over.
+DATE_PATTERN = re.compile(
+    r"(?P<ymd>(?P<ymd_year>[0-9]{4})(?P<ymd_sep>[-/])(?P<ymd_month>[0-9]{1,2})"
+    r"(?P=ymd_sep)(?P<ymd_day>[0-9]{1,2}| [0-9]))"
+    # Two-digit years are only accepted with slashes (12/2/26).
+    r"|(?P<numeric>(?P<num_first>[0-9]{1,2})(?P<num_sep>[-/])(?P<num_second>[0-9]{1,2}| [0-9])"
+    r"(?P=num_sep)(?P<num_year>[0-9]{4}|(?<=/)[0-9]{2}))"
+    r"|(?P<month_day>(?P<md_month>[a-z]+)\s+(?P<md_day>[0-9]{1,2}),\s+(?P<md_year>[0-9]{4}))"
+    r"|(?P<day_month>(?P<dm_day>[0-9]{1,2})\s+(?P<dm_month>[a-z]+)\s+(?P<dm_year>[0-9]{4}))",
+    re.IGNORECASE,
+)
+MONTH_NAMES = tuple(calendar.month_name)  # ("", "January", ..., "December")
+MONTHS = {
+    name.lower(): number
+    for names in (calendar.month_name, calendar.month_abbr)
+    for number, name in enumerate(names)
+    if name
+}
+TIME_PATTERN = re.compile(r"([0-9]{1,2})(?::([0-9]{1,2})(?::([0-9]{1,2}))?)?\s*(AM|PM)?")
+
+# Inputs come straight from chat messages, so only short ones are memoized;
+# otherwise a client could pin up to 1024 arbitrarily large strings per worker.
+MAX_CACHED_INPUT_LENGTH = 64
+
+def _cached(func, text: str):
+    """Call an lru_cache'd parser, bypassing the cache for long input."""
+    if len(text) <= MAX_CACHED_INPUT_LENGTH:
+        return func(text)
+    return func.__wrapped__(text)
+
+def parse_date(date_str: str) -> Optional[str]:
+    """Parse various date formats and return standardized format, or None if invalid."""
+    # Normalize before the cache so "2025-02-15" and " 2025-02-15 " share an entry.
+    return _cached(_parse_date, date_str.strip())
+
+@lru_cache(maxsize=1024)
+def _parse_date(date_str: str) -> Optional[str]:
+    match = DATE_PATTERN.fullmatch(date_str)
+    if match is None:
+        return None
+
+    shape = match.lastgroup
+    if shape == "ymd":
+        candidates = [(int(match["ymd_year"]), int(match["ymd_month"]), int(match["ymd_day"]))]
+    elif shape == "numeric":
+        year = int(match["num_year"])
+        if len(match["num_year"]) == 2:
+            year += 2000 if year <= 68 else 1900
+        first, second = int(match["num_first"]), int(match["num_second"])
+        # Month first (12/2/2026), then day first (2/12/2026) if that isn't a real date.
+        candidates = [(year, first, second)]
+        # " 2" is accepted as a day but never as a month.
+        if match["num_second"][0] != " ":
+            candidates.append((year, second, first))
+    elif shape == "month_day":
+        month = MONTHS.get(match["md_month"].lower())
+        if month is None:
+            return None
+        candidates = [(int(match["md_year"]), month, int(match["md_day"]))]
+    else:
+        month = MONTHS.get(match["dm_month"].lower())
+        if month is None:
+            return None
+        candidates = [(int(match["dm_year"]), month, int(match["dm_day"]))]
+
+    for year, month, day in candidates:
+        # Checked up front so an impossible date costs no ValueError.
+        if year < 1 or not 1 <= month <= 12:
+            continue
+        if not 1 <= day <= calendar.monthrange(year, month)[1]:
+            continue
+        return f"{MONTH_NAMES[month]} {day:02d}, {year}"
+
+    return None
+
+def parse_time(time_str: str) -> Optional[str]:
+    """Parse various time formats and return standardized format, or None if invalid."""
+    # Normalize before the cache so "2pm", "2PM" and " 2pm" share an entry.
+    return _cached(_parse_time, time_str.strip().upper())
+
+@lru_cache(maxsize=1024)
+def _parse_time(time_str: str) -> Optional[str]:
+    if time_str.isascii() and time_str.isdigit():
+        # Bare hour ("10"): skip the regex. Same rules as below, so "14" is
+        # rejected rather than read as 24-hour, and "1430" is not a time.
+        if len(time_str) > 2 or not 1 <= int(time_str) <= 12:
+            return None
+        return f"{int(time_str):02d}:00 AM"
+
+    match = TIME_PATTERN.fullmatch(time_str)
+    if match is None:
+        return None
+
+    hour, minute, second, am_pm = match.groups()
+    hour = int(hour)
+    if minute is None:
+        # A bare hour ("10", "2pm") is on the 12-hour clock, morning by default.
+        minute = 0
+        am_pm = am_pm or "AM"
+    else:
+        minute = int(minute)
+        if minute > 59 or (second is not None and int(second) > 59):
+            return None
+
+    if am_pm:
+        if hour < 1 or hour > 12:
+            return None
+    else:
+        # 24-hour clock ("14:30"): convert to 12-hour.
+        if hour > 23:
+            return None
+        am_pm = "PM" if hour >= 12 else "AM"
+        hour = (hour - 1) % 12 + 1
+
+    return f"{hour:02d}:{minute:02d} {am_pm}"
+
+def parse_intent(user_input: str) -> str:
+    """Parse user input to determine intent."""
+    # Typed input is usually already lowercase ASCII; skip the copy then.
+    text = user_input if user_input.isascii() and user_input.islower() else user_input.lower()
+    return _cached(_match_intent, text)
+
+@lru_cache(maxsize=1024)
+def _match_intent(text: str) -> str:
+    if INTENT_AUTOMATON is None:
+        for intent, pattern in INTENT_PATTERNS:
+            if pattern.search(text):
+                return intent
+        return "unknown"
+
+    intent = None
+    for _, candidate in INTENT_AUTOMATON.iter(text):
+        # Earlier intents win regardless of where they appear in the text.
+        if intent is None or INTENT_PRIORITY[candidate] < INTENT_PRIORITY[intent]:
+            intent = candidate
+            if intent == "book":
+                break
+
+    return intent or "unknown"